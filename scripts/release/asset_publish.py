@@ -5,20 +5,26 @@
 
 
 import argparse
+import asyncio
+import functools
 import json
 import re
 import shutil
 import sys
 from azure.ai.ml import MLClient
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import AzureCliCredential
 import azureml.assets as assets
 import azureml.assets.util as util
 from pathlib import Path
 from string import Template
-from subprocess import run
+from subprocess import CompletedProcess
 from tempfile import TemporaryDirectory
 from collections import defaultdict
-from typing import Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Set, Tuple, Union
+import yaml as pyyaml
 from azureml.assets.config import AssetConfig
 from azureml.assets.model.model_utils import prepare_model, update_model_metadata
 from azureml.assets.util import logger
@@ -26,6 +32,13 @@ from azureml.assets.deployment_config import AssetVersionUpdate
 from azure.ai.ml.entities import Component, Environment, Model
 from ruamel.yaml import YAML
 
+try:
+    # libyaml-backed loader for read-only parsing; ruamel's round-trip parser is
+    # only used where files are rewritten with formatting preserved
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 ASSET_ID_TEMPLATE = Template("azureml://registries/$registry_name/$asset_type/$asset_name/versions/$version")
 TEST_YML = "tests.yml"
@@ -35,56 +48,109 @@ CREATE_ORDER = [assets.AssetType.DATA, assets.AssetType.ENVIRONMENT, assets.Asse
 WORKSPACE_ASSET_PATTERN = re.compile(r"^(?:azureml:)?(.+)(?::(.+)|@(.+))$")
 REGISTRY_ENV_PATTERN = re.compile(r"^azureml://registries/(.+)/environments/(.+)/(?:versions/(.+)|labels/(.+))")
 REGISTRY_ASSET_TEMPLATE = Template("^azureml://registries/(.+)/$asset_type/(.+)/(?:versions/(.+)|labels/(.+))")
-BEARER = r"Bearer.*"
+# Bounded to the rest of the line (including carriage returns), so redaction is a
+# strict linear scan even over multi-megabyte debug output
+BEARER = r"Bearer[^\r\n]*"
+BEARER_PATTERN = re.compile(BEARER)
 LATEST_LABEL = "latest"
 
 
+_ML_CLIENTS: Dict[str, MLClient] = {}
+
+
+def get_mlclient(registry_name: str) -> MLClient:
+    """Return an MLClient for the registry, cached per registry name."""
+    if registry_name not in _ML_CLIENTS:
+        logger.print(f"Creating mlclient for registry {registry_name}")
+        _ML_CLIENTS[registry_name] = MLClient(credential=AzureCliCredential(), registry_name=registry_name)
+    return _ML_CLIENTS[registry_name]
+
+
+@functools.lru_cache(maxsize=16)
 def pluralize_asset_type(asset_type: Union[assets.AssetType, str]) -> str:
-    """Return pluralized asset type."""
+    """Return pluralized asset type, cached since the domain is a handful of values."""
     # Convert to string if enum
     if isinstance(asset_type, assets.AssetType):
         asset_type = asset_type.value
     return f"{asset_type}s" if asset_type != "data" else asset_type
 
 
+# Registry asset URI patterns, compiled once per asset type instead of per parsed URI
+REGISTRY_ASSET_PATTERNS = {
+    asset_type.value: re.compile(REGISTRY_ASSET_TEMPLATE.substitute(
+        asset_type=pluralize_asset_type(asset_type)))
+    for asset_type in assets.AssetType
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _load_yaml_cached(path_str: str, mtime: float):
+    """Load a YAML file with ruamel, cached by path and modification time.
+
+    Specs are read by the existence check, component validation and metadata
+    update of the same asset; keying on mtime keeps the cache correct when a
+    validation step rewrites the file.
+    """
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    with open(path_str) as f:
+        return yaml.load(f)
+
+
+def load_spec(spec_path: Path):
+    """Load a spec file through the in-memory cache."""
+    return _load_yaml_cached(str(spec_path), spec_path.stat().st_mtime)
+
+
+def _find_test_files_in_folder(test: Path) -> List[str]:
+    """Find test files referenced by a single test folder."""
+    logger.print(f"Processing test folder {test.name}")
+    test_jobs = []
+    with open(test / TEST_YML) as fp:
+        data = pyyaml.load(fp, Loader=YamlSafeLoader)
+        for test_group in data.values():
+            for test_job in test_group['jobs'].values():
+                if 'job' in test_job:
+                    test_jobs.append((test / test_job['job']).as_posix())
+    return test_jobs
+
+
 def find_test_files(dir: Path):
     """Find test files in the directory."""
-    test_jobs = []
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(_find_test_files_in_folder, dir.iterdir())
+    return [test_job for folder_jobs in results for test_job in folder_jobs]
 
-    for test in dir.iterdir():
-        logger.print(f"Processing test folder {test.name}")
-        with open(test / TEST_YML) as fp:
-            data = YAML().load(fp)
-            for test_group in data.values():
-                for test_job in test_group['jobs'].values():
-                    if 'job' in test_job:
-                        test_jobs.append((test / test_job['job']).as_posix())
-    return test_jobs
+
+def _preprocess_test_file(test_job: str, asset_ids: Dict[str, str]):
+    """Rewrite asset references in a single test file."""
+    logger.print(f"Processing test job {test_job}")
+    with open(test_job) as fp:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.default_flow_style = False
+        data = yaml.load(fp)
+        for job_name, job in data['jobs'].items():
+            asset_name = job['component']
+            logger.print(f"Processing asset {asset_name}")
+            if asset_name in asset_ids:
+                job['component'] = asset_ids.get(asset_name)
+                logger.print(f"For job {job_name}, the new asset id is {job['component']}")
+        with open(test_job, "w") as file:
+            yaml.dump(data, file)
 
 
 def preprocess_test_files(test_jobs: List[str], asset_ids: Dict[str, str]):
     """Preprocess test files to generate asset ids."""
-    for test_job in test_jobs:
-        logger.print(f"Processing test job {test_job}")
-        with open(test_job) as fp:
-            yaml = YAML()
-            yaml.preserve_quotes = True
-            yaml.default_flow_style = False
-            data = yaml.load(fp)
-            for job_name, job in data['jobs'].items():
-                asset_name = job['component']
-                logger.print(f"Processing asset {asset_name}")
-                if asset_name in asset_ids:
-                    job['component'] = asset_ids.get(asset_name)
-                    logger.print(f"For job {job_name}, the new asset id is {job['component']}")
-            with open(test_job, "w") as file:
-                yaml.dump(data, file)
+    with ThreadPoolExecutor() as executor:
+        # Consume the iterator so worker exceptions propagate
+        list(executor.map(lambda test_job: _preprocess_test_file(test_job, asset_ids), test_jobs))
 
 
 def sanitize_output(input: str) -> str:
     """Return sanitized string."""
     # Remove sensitive token
-    sanitized_output = re.sub(BEARER, "", input)
+    sanitized_output = BEARER_PATTERN.sub("", input)
     return sanitized_output
 
 
@@ -99,7 +165,8 @@ def update_spec(asset: Union[Component, Environment, Model], spec_path: Path) ->
     :rtype: bool
     """
     try:
-        asset_dict = json.loads(json.dumps(asset._to_dict()))
+        # _to_dict already returns plain serializable types; no need to round-trip through JSON
+        asset_dict = asset._to_dict()
         util.dump_yaml(asset_dict, spec_path)
         return True
     except Exception as e:
@@ -133,7 +200,7 @@ def prepare_model_for_registration(
     return success
 
 
-def validate_and_prepare_pipeline_component(
+async def validate_and_prepare_pipeline_component(
     spec_path: Path,
     version_suffix: str,
     registry_name: str,
@@ -149,12 +216,11 @@ def validate_and_prepare_pipeline_component(
     :return: True for successful validation and update
     :rtype: bool
     """
-    with open(spec_path) as f:
-        try:
-            pipeline_dict = YAML().load(f)
-        except Exception:
-            logger.log_error(f"Error in loading component spec at {spec_path}")
-            return False
+    try:
+        pipeline_dict = load_spec(spec_path)
+    except Exception:
+        logger.log_error(f"Error in loading component spec at {spec_path}")
+        return False
 
     jobs = pipeline_dict['jobs']
     logger.print(f"Preparing pipeline component {pipeline_dict['name']}")
@@ -195,9 +261,10 @@ def validate_and_prepare_pipeline_component(
         registry_name = registry or registry_name
         asset_details = None
         for ver in [version, final_version]:
-            if (asset_details := get_asset_details(
-                assets.AssetType.COMPONENT.value, name, ver, registry_name
-            )) is not None:
+            if await has_asset_version(assets.AssetType.COMPONENT.value, name, ver, registry_name):
+                asset_details = await get_asset_details(
+                    assets.AssetType.COMPONENT.value, name, ver, registry_name
+                )
                 break
 
         if not asset_details:
@@ -219,7 +286,12 @@ def validate_and_prepare_pipeline_component(
     return True
 
 
-def get_environment_asset_id(
+# Many components share a handful of environments; resolutions are memoized so each
+# environment reference is resolved at most once per run. Failures are not cached.
+_environment_asset_id_cache: Dict[Tuple[str, str, str], str] = {}
+
+
+async def get_environment_asset_id(
     environment_id: str,
     version_suffix: str,
     registry_name: str
@@ -235,6 +307,23 @@ def get_environment_asset_id(
     :return: Environment's full asset ID if successful, else None
     :rtype: Union[str, None]
     """
+    cache_key = (environment_id, version_suffix, registry_name)
+    if cache_key in _environment_asset_id_cache:
+        return _environment_asset_id_cache[cache_key]
+    asset_id = await _single_flight.do(
+        ("env-id",) + cache_key,
+        lambda: _resolve_environment_asset_id(environment_id, version_suffix, registry_name))
+    if isinstance(asset_id, str):
+        _environment_asset_id_cache[cache_key] = asset_id
+    return asset_id
+
+
+async def _resolve_environment_asset_id(
+    environment_id: str,
+    version_suffix: str,
+    registry_name: str
+) -> Union[object, None]:
+    """Resolve an environment reference against the registry, uncached."""
     try:
         env_name, env_version, env_label, env_registry_name = get_parsed_details_from_asset_uri(
             assets.AssetType.ENVIRONMENT.value, environment_id)
@@ -259,7 +348,7 @@ def get_environment_asset_id(
         if env_label == LATEST_LABEL:
             # TODO: Use a more direct approach like this, when supported by Azure CLI:
             # az ml environment show --name sklearn-1.1-ubuntu20.04-py38-cpu --registry-name azureml --label latest
-            versions = get_asset_versions(assets.AssetType.ENVIRONMENT.value, env_name, registry_name)
+            versions = await get_asset_versions(assets.AssetType.ENVIRONMENT.value, env_name, registry_name)
             if versions:
                 # List is returned with the latest version at the beginning
                 env_version = versions[0]
@@ -278,16 +367,15 @@ def get_environment_asset_id(
     if version_suffix:
         versions_to_try.append(f"{env_version}-{version_suffix}")
     for version in versions_to_try:
-        if (env := get_asset_details(
-            assets.AssetType.ENVIRONMENT.value, env_name, version, registry_name
-        )) is not None:
+        if await has_asset_version(assets.AssetType.ENVIRONMENT.value, env_name, version, registry_name):
+            env = await get_asset_details(assets.AssetType.ENVIRONMENT.value, env_name, version, registry_name)
             return env['id']
 
     logger.log_error(f"Environment {env_name} not found in {registry_name}; tried version(s) {versions_to_try}")
     return None
 
 
-def validate_update_component(
+async def validate_update_component(
     spec_path: Path,
     version_suffix: str,
     registry_name: str,
@@ -303,12 +391,11 @@ def validate_update_component(
     :return: True for successful validation and update
     :rtype: bool
     """
-    with open(spec_path) as f:
-        try:
-            component_dict = YAML().load(f)
-        except Exception:
-            logger.log_error(f"Error in loading component spec at {spec_path}")
-            return False
+    try:
+        component_dict = load_spec(spec_path)
+    except Exception:
+        logger.log_error(f"Error in loading component spec at {spec_path}")
+        return False
 
     component_name = component_dict['name']
     logger.print(f"Preparing component {component_name}")
@@ -326,7 +413,7 @@ def validate_update_component(
 
     # Update environment reference
     current_env_id = obj_with_env['environment']
-    new_env_id = get_environment_asset_id(current_env_id, version_suffix, registry_name)
+    new_env_id = await get_environment_asset_id(current_env_id, version_suffix, registry_name)
     if new_env_id is not None:
         if current_env_id != new_env_id:
             logger.print(f"Updating environment to {new_env_id}")
@@ -345,10 +432,21 @@ def validate_update_component(
     return True
 
 
-def run_command(cmd: List[str]):
-    """Run the command for and return result."""
-    result = run(cmd, capture_output=True, encoding=sys.stdout.encoding, errors="ignore")
-    return result
+async def run_command(cmd: List[str]) -> CompletedProcess:
+    """Run the command without blocking the event loop and return result.
+
+    Output is captured as bytes; callers decode only what they actually log.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    return CompletedProcess(cmd, process.returncode, stdout=stdout, stderr=stderr)
+
+
+def decode_output(data: bytes) -> str:
+    """Decode captured subprocess output for logging."""
+    return data.decode(sys.stdout.encoding or "utf-8", errors="ignore")
 
 
 def asset_create_command(
@@ -376,7 +474,7 @@ def asset_create_command(
     return cmd
 
 
-def create_asset(
+async def create_asset(
     asset: assets.AssetConfig,
     registry_name: str,
     resource_group: str,
@@ -392,22 +490,36 @@ def create_asset(
     )
 
     # Run command
-    result = run_command(cmd)
+    result = await run_command(cmd)
     if debug_mode:
         # Capture and redact output
         logger.print(f"Executed: {cmd}")
-        redacted_output = sanitize_output(result.stdout)
+        redacted_output = sanitize_output(decode_output(result.stdout))
         if redacted_output:
             logger.print(f"STDOUT: {redacted_output}")
 
     if result.returncode != 0:
-        redacted_err = sanitize_output(result.stderr)
+        redacted_err = sanitize_output(decode_output(result.stderr))
         logger.log_error(f"Error creating {asset.type.value} {asset.name}: {redacted_err}")
         failure_list.append(asset)
-
-
-def update_asset_metadata(mlclient: MLClient, asset: AssetConfig):
-    """Update the mutable metadata of asset."""
+    else:
+        # The asset exists now; drop any cached not-found results from the
+        # pre-create existence checks so later dependency lookups re-query it.
+        for ver in {version, asset.version}:
+            _asset_details_cache.pop((asset.type.value, asset.name, ver, registry_name), None)
+        _asset_versions_cache.pop((asset.type.value, asset.name, registry_name), None)
+
+
+def update_asset_metadata(mlclient: MLClient, asset: AssetConfig, spec_dict: Dict = None):
+    """Update the mutable metadata of asset.
+
+    :param mlclient: MLClient handle to the registry
+    :type mlclient: MLClient
+    :param asset: asset whose metadata to update
+    :type asset: AssetConfig
+    :param spec_dict: already-parsed spec contents, to skip rereading the file
+    :type spec_dict: Dict
+    """
     if asset.type == assets.AssetType.MODEL:
         model_name = asset.name
         model_version = asset.version
@@ -417,17 +529,13 @@ def update_asset_metadata(mlclient: MLClient, asset: AssetConfig):
         # get tags to update from model spec file
         tags_to_update = None
         try:
-            with open(spec_path) as f:
-                model_spec = YAML().load(f)
-                tags = model_spec.get("tags", {})
-                # convert tag value to string
-                for name, value in tags.items():
-                    if isinstance(value, dict):
-                        value = json.dumps(value)
-                    else:
-                        value = str(value)
-                    tags[name] = value
-                tags_to_update = {"replace": tags}
+            model_spec = spec_dict if spec_dict is not None else load_spec(spec_path)
+            # convert tag values to strings in a single pass
+            tags = {
+                name: json.dumps(value) if isinstance(value, dict) else str(value)
+                for name, value in (model_spec.get("tags") or {}).items()
+            }
+            tags_to_update = {"replace": tags}
         except Exception as e:
             logger.log_error(f"Failed to get tags for model {model_name}: {e}")
 
@@ -445,44 +553,336 @@ def update_asset_metadata(mlclient: MLClient, asset: AssetConfig):
         logger.print(f"Skipping metadata update of {asset.name}. Not supported for type {asset.type}")
 
 
-def get_asset_versions(
+# Model preparation downloads and copies large artifacts; a dedicated bounded pool
+# keeps it from starving the default executor used for quick SDK calls.
+_MODEL_PREP_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="model-prep")
+
+
+class SingleFlight:
+    """Collapse concurrent identical lookups into a single in-flight call.
+
+    Workers requesting a key while a call for it is already running await the
+    first call's result instead of issuing a duplicate RPC; the memoization
+    caches only help once a result has landed.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def do(self, key: Tuple, coro_factory):
+        """Run coro_factory for key, or await the call already in flight for it."""
+        if key in self._inflight:
+            return await self._inflight[key]
+        future = asyncio.ensure_future(coro_factory())
+        self._inflight[key] = future
+        try:
+            return await future
+        finally:
+            self._inflight.pop(key, None)
+
+
+_single_flight = SingleFlight()
+
+
+# Registry content is effectively immutable during a publish run, so lookups are
+# memoized for its duration. Not-found results are cached too, to avoid re-querying
+# assets that legitimately don't exist yet.
+_asset_versions_cache: Dict[Tuple[str, str, str], List[str]] = {}
+_asset_details_cache: Dict[Tuple[str, str, str, str], Dict] = {}
+
+
+async def get_asset_versions(
     asset_type: str,
     asset_name: str,
     registry_name: str,
 ) -> List[str]:
     """Get asset versions from registry."""
-    cmd = [
-        "az", "ml", asset_type, "list",
-        "--name", asset_name,
-        "--registry-name", registry_name,
-    ]
-    result = run_command(cmd)
-    if result.returncode != 0:
-        logger.log_error(f"Failed to list assets: {result.stderr}")
+    cache_key = (asset_type, asset_name, registry_name)
+    if cache_key in _asset_versions_cache:
+        return _asset_versions_cache[cache_key]
+    return await _single_flight.do(
+        ("versions",) + cache_key,
+        lambda: _fetch_asset_versions(asset_type, asset_name, registry_name))
+
+
+async def _fetch_asset_versions(
+    asset_type: str,
+    asset_name: str,
+    registry_name: str,
+) -> List[str]:
+    """List asset versions from the registry and populate the cache."""
+    cache_key = (asset_type, asset_name, registry_name)
+    if cache_key in _asset_versions_cache:
+        return _asset_versions_cache[cache_key]
+    operations = getattr(get_mlclient(registry_name), pluralize_asset_type(asset_type))
+
+    def _list_versions():
+        return [a.version for a in operations.list(name=asset_name)]
+
+    try:
+        versions = await asyncio.get_running_loop().run_in_executor(None, _list_versions)
+    except Exception as e:
+        logger.log_error(f"Failed to list assets: {e}")
         return []
-    return [a['version'] for a in json.loads(result.stdout)]
+    _asset_versions_cache[cache_key] = versions
+    return versions
 
 
-def get_asset_details(
+async def has_asset_version(
+    asset_type: str,
+    asset_name: str,
+    asset_version: str,
+    registry_name: str,
+) -> bool:
+    """Check whether an asset version exists in the registry.
+
+    Existence is answered from a single cached versions listing per
+    (type, name, registry) instead of one point lookup per version.
+    """
+    return asset_version in await get_asset_versions(asset_type, asset_name, registry_name)
+
+
+async def get_asset_details(
     asset_type: str,
     asset_name: str,
     asset_version: str,
     registry_name: str,
 ) -> Dict:
     """Get asset details."""
-    cmd = [
-        "az", "ml", asset_type, "show",
-        "--name", asset_name,
-        "--version", asset_version,
-        "--registry-name", registry_name,
-    ]
-    result = run_command(cmd)
-    if result.returncode != 0:
-        if "Could not find asset" not in result.stderr:
-            # Don't show the error if it's expected for new assets
-            logger.log_error(f"Failed to get asset details: {result.stderr}")
+    cache_key = (asset_type, asset_name, asset_version, registry_name)
+    if cache_key in _asset_details_cache:
+        return _asset_details_cache[cache_key]
+    return await _single_flight.do(
+        ("details",) + cache_key,
+        lambda: _fetch_asset_details(asset_type, asset_name, asset_version, registry_name))
+
+
+async def _fetch_asset_details(
+    asset_type: str,
+    asset_name: str,
+    asset_version: str,
+    registry_name: str,
+) -> Dict:
+    """Get asset details from the registry and populate the cache."""
+    cache_key = (asset_type, asset_name, asset_version, registry_name)
+    if cache_key in _asset_details_cache:
+        return _asset_details_cache[cache_key]
+    operations = getattr(get_mlclient(registry_name), pluralize_asset_type(asset_type))
+
+    def _get_details():
+        asset = operations.get(name=asset_name, version=asset_version)
+        details = asset._to_dict()
+        details.setdefault("id", asset.id)
+        return details
+
+    try:
+        details = await asyncio.get_running_loop().run_in_executor(None, _get_details)
+    except ResourceNotFoundError:
+        # Expected for new assets
+        details = None
+    except Exception as e:
+        logger.log_error(f"Failed to get asset details: {e}")
         return None
-    return json.loads(result.stdout)
+    _asset_details_cache[cache_key] = details
+    return details
+
+
+async def publish_asset(
+    asset: AssetConfig,
+    asset_names: Set[str],
+    registry_name: str,
+    resource_group: str,
+    workspace: str,
+    version_suffix: str,
+    mlclient: MLClient,
+    asset_ids: Dict[str, str],
+    failure_list: List[AssetConfig],
+    semaphore: asyncio.Semaphore,
+    debug_mode: bool = None,
+):
+    """Publish a single asset to the registry.
+
+    :param asset: Asset config to publish
+    :type asset: AssetConfig
+    :param asset_names: Asset names from the create list, or "*" for all
+    :type asset_names: Set[str]
+    :param registry_name: name of the registry to create the asset in
+    :type registry_name: str
+    :param resource_group: resource group of the registry
+    :type resource_group: str
+    :param workspace: workspace name
+    :type workspace: str
+    :param version_suffix: version suffix
+    :type version_suffix: str
+    :param mlclient: MLClient handle to the registry
+    :type mlclient: MLClient
+    :param asset_ids: mapping of asset name to full asset ID, updated in place
+    :type asset_ids: Dict[str, str]
+    :param failure_list: assets that failed to publish, updated in place
+    :type failure_list: List[AssetConfig]
+    :param semaphore: semaphore bounding concurrent publish operations
+    :type semaphore: asyncio.Semaphore
+    :param debug_mode: whether to run creation commands in debug mode
+    :type debug_mode: bool
+    """
+    # Filter before acquiring the semaphore so skipped assets don't occupy a slot
+    if not ("*" in asset_names or asset.name in asset_names):
+        logger.print(
+            f"Skipping asset {asset.name} because it is not in the create list")
+        return
+
+    async with semaphore:
+        final_version = asset.version + "-" + \
+            version_suffix if version_suffix else asset.version
+        logger.print(f"Creating {asset.name} {final_version}")
+        # Same shape as ASSET_ID_TEMPLATE; formatted directly to avoid re-parsing
+        # the template per asset
+        asset_ids[asset.name] = (
+            f"azureml://registries/{registry_name}/{pluralize_asset_type(asset.type)}"
+            f"/{asset.name}/versions/{final_version}"
+        )
+
+        if await has_asset_version(asset.type.value, asset.name, asset.version, registry_name):
+            logger.print(f"{asset.name} {asset.version} already exists, updating the metadata")
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, update_asset_metadata, mlclient, asset)
+            except Exception as e:
+                logger.log_error(f"Failed to update metadata for {asset.name}:{asset.version} - {e}")
+            return
+
+        # Only model preparation needs scratch space on disk, and only for assets
+        # that made it past the filters above
+        work_dir_ctx = TemporaryDirectory() if asset.type == assets.AssetType.MODEL else nullcontext(None)
+        with work_dir_ctx as work_dir:
+            # Handle specific asset types
+            if asset.type == assets.AssetType.COMPONENT:
+                # load component and check if environment exists
+                component_type = asset.spec_as_object().type
+                if component_type == assets.ComponentType.PIPELINE.value:
+                    if not await validate_and_prepare_pipeline_component(
+                        asset.spec_with_path, version_suffix, registry_name
+                    ):
+                        failure_list.append(asset)
+                        return
+                elif component_type is None or component_type in [assets.ComponentType.COMMAND.value,
+                                                                  assets.ComponentType.PARALLEL.value]:
+                    if not await validate_update_component(
+                        asset.spec_with_path, version_suffix, registry_name
+                    ):
+                        failure_list.append(asset)
+                        return
+            elif asset.type == assets.AssetType.MODEL:
+                try:
+                    final_version = asset.version
+                    model_config = asset.extra_config_as_object()
+                    prepared = await asyncio.get_running_loop().run_in_executor(
+                        _MODEL_PREP_EXECUTOR, prepare_model_for_registration,
+                        model_config, asset.spec_with_path, Path(work_dir), registry_name)
+                    if not prepared:
+                        raise Exception(f"Could not prepare model at {asset.spec_with_path}")
+                except Exception as e:
+                    logger.log_error(f"Model prepare exception: {e}")
+                    failure_list.append(asset)
+                    return
+
+            # Create asset
+            await create_asset(
+                asset=asset,
+                version=final_version,
+                registry_name=registry_name,
+                resource_group=resource_group,
+                workspace_name=workspace,
+                failure_list=failure_list,
+                debug_mode=debug_mode,
+            )
+
+
+async def publish_assets(
+    assets_by_type: Dict[str, List[AssetConfig]],
+    create_list: Dict[str, List[str]],
+    registry_name: str,
+    resource_group: str,
+    workspace: str,
+    version_suffix: str,
+    mlclient: MLClient,
+    asset_ids: Dict[str, str],
+    failure_list: List[AssetConfig],
+    debug_mode: bool = None,
+):
+    """Publish all assets from the create list, in dependency order.
+
+    Assets of each type are published concurrently, bounded by a semaphore.
+    Pipeline components are published in a second wave after all other
+    components, since they can depend on them.
+
+    :param assets_by_type: assets to publish, keyed by asset type
+    :type assets_by_type: Dict[str, List[AssetConfig]]
+    :param create_list: asset names to create, keyed by asset type
+    :type create_list: Dict[str, List[str]]
+    :param registry_name: name of the registry to create assets in
+    :type registry_name: str
+    :param resource_group: resource group of the registry
+    :type resource_group: str
+    :param workspace: workspace name
+    :type workspace: str
+    :param version_suffix: version suffix
+    :type version_suffix: str
+    :param mlclient: MLClient handle to the registry
+    :type mlclient: MLClient
+    :param asset_ids: mapping of asset name to full asset ID, updated in place
+    :type asset_ids: Dict[str, str]
+    :param failure_list: assets that failed to publish, updated in place
+    :type failure_list: List[AssetConfig]
+    :param debug_mode: whether to run creation commands in debug mode
+    :type debug_mode: bool
+    """
+    semaphore = asyncio.Semaphore(16)
+    for create_asset_type in CREATE_ORDER:
+        logger.print(f"Creating {create_asset_type.value} assets.")
+        if create_asset_type.value not in create_list:
+            continue
+
+        assets_to_publish = assets_by_type.get(create_asset_type.value, [])
+        # Set membership keeps the per-asset create-list check O(1)
+        asset_names = set(create_list.get(create_asset_type.value, []))
+        if create_asset_type == assets.AssetType.COMPONENT:
+            # publish pipeline components in a second wave, as a pipeline component
+            # can depend on other components being present in the registry
+            logger.print("updating components publishing order")
+            pipeline_components = []
+            other_components = []
+            # spec_as_object caches the parsed spec on the AssetConfig instance, so
+            # this single pass parses each component spec at most once for the run
+            for asset in assets_to_publish:
+                component_type = asset.spec_as_object().type
+                if component_type == assets.ComponentType.PIPELINE.value:
+                    pipeline_components.append(asset)
+                else:
+                    other_components.append(asset)
+            publish_waves = [other_components, pipeline_components]
+        else:
+            publish_waves = [assets_to_publish]
+
+        for wave in publish_waves:
+            if wave:
+                await asyncio.gather(*[
+                    publish_asset(
+                        asset=asset,
+                        asset_names=asset_names,
+                        registry_name=registry_name,
+                        resource_group=resource_group,
+                        workspace=workspace,
+                        version_suffix=version_suffix,
+                        mlclient=mlclient,
+                        asset_ids=asset_ids,
+                        failure_list=failure_list,
+                        semaphore=semaphore,
+                        debug_mode=debug_mode,
+                    )
+                    for asset in wave
+                ])
 
 
 def get_parsed_details_from_asset_uri(asset_type: str, asset_uri: str) -> Tuple[str, str, str, str]:
@@ -497,10 +897,9 @@ def get_parsed_details_from_asset_uri(asset_type: str, asset_uri: str) -> Tuple[
         `label` and `registry_name` will be None for workspace URI.
     :rtype: Tuple
     """
-    REGISTRY_ASSET_PATTERN = re.compile(REGISTRY_ASSET_TEMPLATE.substitute(
-                                        asset_type=pluralize_asset_type(asset_type)))
+    registry_asset_pattern = REGISTRY_ASSET_PATTERNS[asset_type]
     asset_registry_name = None
-    if (match := REGISTRY_ASSET_PATTERN.match(asset_uri)) is not None:
+    if (match := registry_asset_pattern.match(asset_uri)) is not None:
         asset_registry_name, asset_name, asset_version, asset_label = match.groups()
     elif (match := WORKSPACE_ASSET_PATTERN.match(asset_uri)) is not None:
         asset_name, asset_version, asset_label = match.groups()
@@ -583,85 +982,20 @@ if __name__ == "__main__":
     for asset in all_assets:
         assets_by_type[asset.type.value].append(asset)
 
-    logger.print(f"Creating mlclient for registry {registry_name}")
-    mlclient: MLClient = MLClient(credential=AzureCliCredential(), registry_name=registry_name)
-
-    for create_asset_type in CREATE_ORDER:
-        logger.print(f"Creating {create_asset_type.value} assets.")
-        if create_asset_type.value not in create_list:
-            continue
-
-        assets_to_publish = assets_by_type.get(create_asset_type.value, [])
-        if create_asset_type == assets.AssetType.COMPONENT:
-            # sort component list to keep pipline components at the end in publishing list
-            # this is a temporary solution as a pipeline component can have another pipeline component as dependency
-            logger.print("updating components publishing order")
-            assets_to_publish.sort(key=lambda x: x.spec_as_object().type == assets.ComponentType.PIPELINE.value)
-
-        for asset in assets_to_publish:
-            with TemporaryDirectory() as work_dir:
-                asset_names = create_list.get(asset.type.value, [])
-                if not ("*" in asset_names or asset.name in asset_names):
-                    logger.print(
-                        f"Skipping asset {asset.name} because it is not in the create list")
-                    continue
-                final_version = asset.version + "-" + \
-                    passed_version if passed_version else asset.version
-                logger.print(f"Creating {asset.name} {final_version}")
-                asset_ids[asset.name] = ASSET_ID_TEMPLATE.substitute(
-                    registry_name=registry_name,
-                    asset_type=pluralize_asset_type(asset.type),
-                    asset_name=asset.name,
-                    version=final_version,
-                )
-
-                if get_asset_details(asset.type.value, asset.name, asset.version, registry_name):
-                    logger.print(f"{asset.name} {asset.version} already exists, updating the metadata")
-                    try:
-                        update_asset_metadata(mlclient, asset)
-                    except Exception as e:
-                        logger.log_error(f"Failed to update metadata for {asset.name}:{asset.version} - {e}")
-                    continue
-
-                # Handle specific asset types
-                if asset.type == assets.AssetType.COMPONENT:
-                    # load component and check if environment exists
-                    component_type = asset.spec_as_object().type
-                    if component_type == assets.ComponentType.PIPELINE.value:
-                        if not validate_and_prepare_pipeline_component(
-                            asset.spec_with_path, passed_version, registry_name
-                        ):
-                            failure_list.append(asset)
-                            continue
-                    elif component_type is None or component_type in [assets.ComponentType.COMMAND.value,
-                                                                      assets.ComponentType.PARALLEL.value]:
-                        if not validate_update_component(
-                            asset.spec_with_path, passed_version, registry_name
-                        ):
-                            failure_list.append(asset)
-                            continue
-                elif asset.type == assets.AssetType.MODEL:
-                    try:
-                        final_version = asset.version
-                        model_config = asset.extra_config_as_object()
-                        if not prepare_model_for_registration(
-                                model_config, asset.spec_with_path, Path(work_dir), registry_name):
-                            raise Exception(f"Could not prepare model at {asset.spec_with_path}")
-                    except Exception as e:
-                        logger.log_error(f"Model prepare exception: {e}")
-                        failure_list.append(asset)
-                        continue
-
-                # Create asset
-                create_asset(
-                    asset=asset,
-                    version=final_version,
-                    registry_name=registry_name,
-                    resource_group=resource_group,
-                    workspace_name=workspace,
-                    failure_list=failure_list,
-                    debug_mode=debug_mode,
-                )
+    mlclient: MLClient = get_mlclient(registry_name)
+
+    asyncio.run(publish_assets(
+        assets_by_type=assets_by_type,
+        create_list=create_list,
+        registry_name=registry_name,
+        resource_group=resource_group,
+        workspace=workspace,
+        version_suffix=passed_version,
+        mlclient=mlclient,
+        asset_ids=asset_ids,
+        failure_list=failure_list,
+        debug_mode=debug_mode,
+    ))
 
     if len(failure_list) > 0:
         failed_assets = defaultdict(list)